@@ -1,559 +1,853 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-"""
-Spotify → TIDAL GUI wrapper for spotify_to_tidal
-------------------------------------------------
-- Beautiful Tkinter UI (tabs, nice layout) with persistent settings.
-- Uses `keyring` to keep secrets (client_secret, TIDAL password) out of plain text.
-- Builds a temporary config.yml (including secrets) ONLY when running a sync.
-- Wraps the CLI: `python -m spotify_to_tidal <subcommand> [args...]`
-- Shows real-time logs, allows cancel.
-
-Requirements:
-  - Python 3.8+
-  - keyring (pip install keyring)  [optional but strongly recommended]
-  - spotify_to_tidal installed (editable is fine): python -m pip install -e .
-  - git + browser auth for Spotify on first run
-
-Tested on Windows, but should work cross-platform.
-
-"""
-
-import json
-import os
-import sys
-import tempfile
-import shutil
-import subprocess
-import threading
-import queue
-from pathlib import Path
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-
-# --------- Optional secure storage ----------
-try:
-    import keyring
-    KEYRING_AVAILABLE = True
-except Exception:
-    keyring = None
-    KEYRING_AVAILABLE = False
-
-APP_NAME = "spotify_to_tidal_gui"
-SERVICE_NAME = "spotify_to_tidal_gui"  # for keyring
-DEFAULT_REDIRECT_URI = "http://127.0.0.1:8888/callback"  # safer than localhost per repo changes
-
-def app_data_dir() -> Path:
-    base = os.getenv("APPDATA") or os.getenv("XDG_CONFIG_HOME") or str(Path.home() / ".config")
-    return Path(base) / APP_NAME
-
-SETTINGS_PATH = app_data_dir() / "settings.json"
-
-def load_settings():
-    try:
-        app_data_dir().mkdir(parents=True, exist_ok=True)
-        if SETTINGS_PATH.exists():
-            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {
-        "spotify_client_id": "",
-        "spotify_username": "",
-        "spotify_redirect_uri": DEFAULT_REDIRECT_URI,
-        "tidal_username": "",
-        # secrets are in keyring
-        "last_playlist_url": "",
-        "default_subcommand": "sync",  # change if your CLI uses a different default
-    }
-
-def save_settings(data: dict):
-    app_data_dir().mkdir(parents=True, exist_ok=True)
-    with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-
-def set_secret(name: str, value: str):
-    if not KEYRING_AVAILABLE:
-        return False
-    try:
-        keyring.set_password(SERVICE_NAME, name, value or "")
-        return True
-    except Exception:
-        return False
-
-def get_secret(name: str) -> str:
-    if not KEYRING_AVAILABLE:
-        return ""
-    try:
-        v = keyring.get_password(SERVICE_NAME, name)
-        return v or ""
-    except Exception:
-        return ""
-
-class LogConsole(ttk.Frame):
-    def __init__(self, master):
-        super().__init__(master)
-        self.text = tk.Text(self, wrap="word", height=16, state="disabled")
-        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
-        self.text.configure(yscrollcommand=self.scroll.set)
-        self.text.grid(row=0, column=0, sticky="nsew")
-        self.scroll.grid(row=0, column=1, sticky="ns")
-        self.grid_rowconfigure(0, weight=1)
-        self.grid_columnconfigure(0, weight=1)
-
-    def write(self, s: str):
-        self.text.configure(state="normal")
-        self.text.insert("end", s)
-        self.text.see("end")
-        self.text.configure(state="disabled")
-        self.update_idletasks()
-
-    def clear(self):
-        self.text.configure(state="normal")
-        self.text.delete("1.0", "end")
-        self.text.configure(state="disabled")
-
-class App(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Spotify → TIDAL Sync (spotify_to_tidal GUI)")
-        self.geometry("880x620")
-        self.minsize(820, 560)
-        self.style = ttk.Style(self)
-        # Use a built-in theme with nice padding
-        try:
-            self.style.theme_use("clam")
-        except Exception:
-            pass
-
-        self.proc = None
-        self.stop_requested = False
-        self.output_queue = queue.Queue()
-
-        self.settings = load_settings()
-
-        self._build_ui()
-
-        # Fill with saved settings
-        self._load_ui_from_settings()
-
-    # ---------- UI ----------
-    def _build_ui(self):
-        container = ttk.Frame(self, padding=12)
-        container.pack(fill="both", expand=True)
-
-        title = ttk.Label(container, text="Spotify → TIDAL Sync", font=("Segoe UI", 18, "bold"))
-        subtitle = ttk.Label(container, text="Beautiful wrapper for spotify_to_tidal — save credentials, run syncs, and see logs.",
-                             foreground="#555")
-
-        title.grid(row=0, column=0, sticky="w")
-        subtitle.grid(row=1, column=0, sticky="w", pady=(0, 8))
-
-        self.nb = ttk.Notebook(container)
-        self.nb.grid(row=2, column=0, sticky="nsew", pady=(4, 8))
-
-        container.grid_rowconfigure(2, weight=1)
-        container.grid_columnconfigure(0, weight=1)
-
-        # Tabs
-        self.tab_setup = ttk.Frame(self.nb, padding=10)
-        self.tab_sync = ttk.Frame(self.nb, padding=10)
-        self.tab_advanced = ttk.Frame(self.nb, padding=10)
-        self.tab_logs = ttk.Frame(self.nb, padding=10)
-
-        self.nb.add(self.tab_setup, text="Setup")
-        self.nb.add(self.tab_sync, text="Sync")
-        self.nb.add(self.tab_advanced, text="Advanced")
-        self.nb.add(self.tab_logs, text="Logs")
-
-        self._build_setup_tab()
-        self._build_sync_tab()
-        self._build_advanced_tab()
-        self._build_logs_tab()
-
-        # Status bar
-        self.status_var = tk.StringVar(value="Ready.")
-        status = ttk.Label(container, textvariable=self.status_var, anchor="w")
-        status.grid(row=3, column=0, sticky="ew")
-
-    def _build_setup_tab(self):
-        f = self.tab_setup
-
-        sec_spotify = ttk.LabelFrame(f, text="Spotify Credentials", padding=10)
-        sec_tidal = ttk.LabelFrame(f, text="TIDAL Credentials", padding=10)
-
-        # Spotify
-        self.var_spotify_client_id = tk.StringVar()
-        self.var_spotify_client_secret = tk.StringVar()
-        self.var_spotify_username = tk.StringVar()
-        self.var_spotify_redirect = tk.StringVar(value=DEFAULT_REDIRECT_URI)
-
-        ttk.Label(sec_spotify, text="Client ID").grid(row=0, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_spotify, textvariable=self.var_spotify_client_id, width=46).grid(row=0, column=1, sticky="w", padx=4, pady=4)
-
-        ttk.Label(sec_spotify, text="Client Secret").grid(row=1, column=0, sticky="e", padx=4, pady=4)
-        e_secret = ttk.Entry(sec_spotify, textvariable=self.var_spotify_client_secret, width=46, show="•")
-        e_secret.grid(row=1, column=1, sticky="w", padx=4, pady=4)
-
-        ttk.Label(sec_spotify, text="Username").grid(row=2, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_spotify, textvariable=self.var_spotify_username, width=46).grid(row=2, column=1, sticky="w", padx=4, pady=4)
-
-        ttk.Label(sec_spotify, text="Redirect URI").grid(row=3, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_spotify, textvariable=self.var_spotify_redirect, width=46).grid(row=3, column=1, sticky="w", padx=4, pady=4)
-        ttk.Label(sec_spotify, text="(Use 127.0.0.1, not localhost)").grid(row=3, column=2, sticky="w")
-
-        # TIDAL
-        self.var_tidal_username = tk.StringVar()
-        self.var_tidal_password = tk.StringVar()
-
-        ttk.Label(sec_tidal, text="Email / Username").grid(row=0, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_tidal, textvariable=self.var_tidal_username, width=46).grid(row=0, column=1, sticky="w", padx=4, pady=4)
-
-        ttk.Label(sec_tidal, text="Password").grid(row=1, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_tidal, textvariable=self.var_tidal_password, width=46, show="•").grid(row=1, column=1, sticky="w", padx=4, pady=4)
-
-        # Save / Load
-        btns = ttk.Frame(f)
-        ttk.Button(btns, text="Save Settings", command=self.on_save_settings).pack(side="left", padx=4)
-        ttk.Button(btns, text="Load Settings", command=self.on_load_settings_clicked).pack(side="left", padx=4)
-        ttk.Button(btns, text="Clear Secrets", command=self.on_clear_secrets).pack(side="left", padx=4)
-
-        # Layout
-        sec_spotify.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
-        sec_tidal.grid(row=0, column=1, sticky="nsew")
-        btns.grid(row=1, column=0, columnspan=2, sticky="w", pady=8)
-
-        f.grid_columnconfigure(0, weight=1)
-        f.grid_columnconfigure(1, weight=1)
-
-    def _build_sync_tab(self):
-        f = self.tab_sync
-
-        sec_action = ttk.LabelFrame(f, text="Action", padding=10)
-        sec_args = ttk.LabelFrame(f, text="Arguments", padding=10)
-        sec_run = ttk.LabelFrame(f, text="Run", padding=10)
-
-        self.var_action = tk.StringVar(value="sync_playlist_url")
-        self.var_playlist_url = tk.StringVar()
-        self.var_subcommand_custom = tk.StringVar(value=self.settings.get("default_subcommand", "sync"))
-        self.var_extra_flags = tk.StringVar()
-
-        # Action choices
-        ttk.Radiobutton(sec_action, text="Sync this Spotify playlist URL", value="sync_playlist_url",
-                        variable=self.var_action).grid(row=0, column=0, sticky="w", pady=2)
-        ttk.Radiobutton(sec_action, text="Sync liked/favorite tracks", value="sync_favorites",
-                        variable=self.var_action).grid(row=1, column=0, sticky="w", pady=2)
-        ttk.Radiobutton(sec_action, text="Sync all playlists", value="sync_all_playlists",
-                        variable=self.var_action).grid(row=2, column=0, sticky="w", pady=2)
-        ttk.Radiobutton(sec_action, text="Custom subcommand", value="custom",
-                        variable=self.var_action).grid(row=3, column=0, sticky="w", pady=2)
-
-        # Arguments
-        ttk.Label(sec_args, text="Playlist URL").grid(row=0, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_args, textvariable=self.var_playlist_url, width=64).grid(row=0, column=1, sticky="w", padx=4, pady=4)
-        ttk.Label(sec_args, text="(Used when action is 'Sync playlist URL')").grid(row=0, column=2, sticky="w", padx=4)
-
-        ttk.Label(sec_args, text="Custom subcommand").grid(row=1, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_args, textvariable=self.var_subcommand_custom, width=32).grid(row=1, column=1, sticky="w", padx=4, pady=4)
-        ttk.Label(sec_args, text="e.g. sync, favorites, playlists").grid(row=1, column=2, sticky="w", padx=4)
-
-        ttk.Label(sec_args, text="Extra flags").grid(row=2, column=0, sticky="e", padx=4, pady=4)
-        ttk.Entry(sec_args, textvariable=self.var_extra_flags, width=64).grid(row=2, column=1, sticky="w", padx=4, pady=4)
-        ttk.Label(sec_args, text="e.g. --dry-run --no-duplicates").grid(row=2, column=2, sticky="w", padx=4)
-
-        # Run
-        ttk.Button(sec_run, text="Run", command=self.on_run).grid(row=0, column=0, padx=4, pady=4)
-        ttk.Button(sec_run, text="Cancel", command=self.on_cancel).grid(row=0, column=1, padx=4, pady=4)
-
-        # Layout
-        sec_action.grid(row=0, column=0, sticky="nsew")
-        sec_args.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
-        sec_run.grid(row=1, column=0, columnspan=2, sticky="w", pady=8)
-
-        f.grid_columnconfigure(0, weight=1)
-        f.grid_columnconfigure(1, weight=1)
-
-    def _build_advanced_tab(self):
-        f = self.tab_advanced
-        desc = ("Use this if presets don’t match your installed CLI. "
-                "Pick your subcommand and flags on the Sync tab. "
-                "You can also choose a working directory for the process.\n\n"
-                "Note: We generate a temporary config.yml that includes your secrets, "
-                "pass it to the process, then delete it.")
-        ttk.Label(f, text=desc, wraplength=760, foreground="#555").grid(row=0, column=0, sticky="w", pady=(0, 8))
-
-        self.var_work_dir = tk.StringVar(value=str(Path.cwd()))
-        ttk.Label(f, text="Working directory").grid(row=1, column=0, sticky="w")
-        row1 = ttk.Frame(f)
-        row1.grid(row=2, column=0, sticky="ew", pady=4)
-        ttk.Entry(row1, textvariable=self.var_work_dir, width=74).pack(side="left", fill="x", expand=True)
-        ttk.Button(row1, text="Browse…", command=self.on_browse_workdir).pack(side="left", padx=6)
-
-        f.grid_columnconfigure(0, weight=1)
-
-    def _build_logs_tab(self):
-        f = self.tab_logs
-        self.console = LogConsole(f)
-        self.console.grid(row=0, column=0, sticky="nsew")
-        f.grid_rowconfigure(0, weight=1)
-        f.grid_columnconfigure(0, weight=1)
-
-        rows = ttk.Frame(f)
-        rows.grid(row=1, column=0, sticky="ew", pady=6)
-        ttk.Button(rows, text="Clear Logs", command=self.console.clear).pack(side="left", padx=4)
-
-    def _load_ui_from_settings(self):
-        s = self.settings
-        self.var_spotify_client_id.set(s.get("spotify_client_id", ""))
-        self.var_spotify_username.set(s.get("spotify_username", ""))
-        self.var_spotify_redirect.set(s.get("spotify_redirect_uri", DEFAULT_REDIRECT_URI))
-        self.var_tidal_username.set(s.get("tidal_username", ""))
-        self.var_playlist_url.set(s.get("last_playlist_url", ""))
-
-        if KEYRING_AVAILABLE:
-            self.var_spotify_client_secret.set(get_secret("spotify_client_secret") or "")
-            self.var_tidal_password.set(get_secret("tidal_password") or "")
-        else:
-            # Warning banner if no keyring
-            messagebox.showwarning(
-                "Keyring not available",
-                "Python 'keyring' is not installed or not working.\n"
-                "Secrets will not be saved securely. Install with:\n\n"
-                "    python -m pip install keyring\n"
-            )
-
-    # ---------- Event handlers ----------
-    def on_save_settings(self):
-        s = self.settings
-        s["spotify_client_id"] = self.var_spotify_client_id.get().strip()
-        s["spotify_username"] = self.var_spotify_username.get().strip()
-        s["spotify_redirect_uri"] = self.var_spotify_redirect.get().strip() or DEFAULT_REDIRECT_URI
-        s["tidal_username"] = self.var_tidal_username.get().strip()
-        s["last_playlist_url"] = self.var_playlist_url.get().strip()
-        save_settings(s)
-
-        ok = True
-        if self.var_spotify_client_secret.get().strip():
-            ok = set_secret("spotify_client_secret", self.var_spotify_client_secret.get().strip()) and ok
-        if self.var_tidal_password.get().strip():
-            ok = set_secret("tidal_password", self.var_tidal_password.get().strip()) and ok
-
-        if ok or not KEYRING_AVAILABLE:
-            messagebox.showinfo("Saved", "Settings saved.")
-        else:
-            messagebox.showwarning("Saved (with issues)",
-                                  "Settings saved, but secrets may not have been stored in keyring.")
-
-    def on_load_settings_clicked(self):
-        self.settings = load_settings()
-        self._load_ui_from_settings()
-        self.set_status("Settings reloaded.")
-
-    def on_clear_secrets(self):
-        if not KEYRING_AVAILABLE:
-            messagebox.showinfo("No keyring", "Keyring not available — nothing to clear.")
-            return
-        try:
-            set_secret("spotify_client_secret", "")
-            set_secret("tidal_password", "")
-            self.var_spotify_client_secret.set("")
-            self.var_tidal_password.set("")
-            messagebox.showinfo("Cleared", "Secrets cleared from keyring.")
-        except Exception:
-            messagebox.showwarning("Error", "Could not clear secrets.")
-
-    def on_browse_workdir(self):
-        d = filedialog.askdirectory(initialdir=self.var_work_dir.get() or str(Path.cwd()))
-        if d:
-            self.var_work_dir.set(d)
-
-    def set_status(self, text: str):
-        self.status_var.set(text)
-        self.update_idletasks()
-
-    def on_cancel(self):
-        if self.proc and self.proc.poll() is None:
-            self.stop_requested = True
-            try:
-                self.proc.terminate()
-            except Exception:
-                pass
-            self.set_status("Cancellation requested…")
-        else:
-            self.set_status("No running process.")
-
-    def on_run(self):
-        # Validate basics
-        if not self.var_spotify_client_id.get().strip():
-            messagebox.showerror("Missing", "Spotify Client ID is required.")
-            return
-        if not (self.var_spotify_client_secret.get().strip() or get_secret("spotify_client_secret")):
-            messagebox.showerror("Missing", "Spotify Client Secret is required.")
-            return
-        if not self.var_spotify_username.get().strip():
-            messagebox.showerror("Missing", "Spotify Username is required.")
-            return
-        if not self.var_tidal_username.get().strip():
-            messagebox.showerror("Missing", "TIDAL Username is required.")
-            return
-        if not (self.var_tidal_password.get().strip() or get_secret("tidal_password")):
-            messagebox.showerror("Missing", "TIDAL Password is required.")
-            return
-
-        # Save current UI values so they persist
-        self.on_save_settings()
-
-        # Prepare command from selections
-        action = self.var_action.get()
-        playlist_url = self.var_playlist_url.get().strip()
-        extra_flags = self._split_flags(self.var_extra_flags.get().strip())
-
-        if action == "sync_playlist_url":
-            if not playlist_url:
-                messagebox.showerror("Missing", "Please paste a Spotify playlist URL.")
-                return
-            subcommand = "sync"  # default common subcommand
-            cmd_args = [subcommand, playlist_url]
-
-        elif action == "sync_favorites":
-            # Not all versions use the same subcommand; allow custom override via the custom field if needed.
-            # Try common possibilities here:
-            subcommand = "favorites"  # try 'favorites' first; change to 'sync-favorites' if your CLI needs it
-            cmd_args = [subcommand]
-
-        elif action == "sync_all_playlists":
-            # Again, this varies; often it's 'playlists' or 'sync-playlists'.
-            subcommand = "playlists"
-            cmd_args = [subcommand]
-
-        else:  # custom
-            subcommand = self.var_subcommand_custom.get().strip() or "sync"
-            cmd_args = [subcommand]
-            if playlist_url:
-                # If user provided a URL, pass it as next arg
-                cmd_args.append(playlist_url)
-
-        # Append extra flags
-        cmd_args.extend(extra_flags)
-
-        # Run in background thread (non-blocking UI)
-        self.console.clear()
-        self.set_status("Running…")
-        self.stop_requested = False
-        t = threading.Thread(target=self._run_worker, args=(cmd_args,), daemon=True)
-        t.start()
-        self.after(100, self._drain_output_queue)
-
-    @staticmethod
-    def _split_flags(s: str):
-        # naive split respecting simple quotes
-        import shlex
-        if not s:
-            return []
-        try:
-            return shlex.split(s)
-        except Exception:
-            return s.split()
-
-    # ---------- Process runner ----------
-    def _build_temp_config(self) -> Path:
-        tmpdir = Path(tempfile.mkdtemp(prefix="s2t_gui_"))
-        cfg = tmpdir / "config.yml"
-
-        # Pull secrets from fields or keyring
-        client_secret = self.var_spotify_client_secret.get().strip() or get_secret("spotify_client_secret")
-        tidal_password = self.var_tidal_password.get().strip() or get_secret("tidal_password")
-
-        content = [
-            "spotify:",
-            f"  client_id: {self.var_spotify_client_id.get().strip()}",
-            f"  client_secret: {client_secret}",
-            f"  username: {self.var_spotify_username.get().strip()}",
-            f"  redirect_uri: {self.var_spotify_redirect.get().strip() or DEFAULT_REDIRECT_URI}",
-            "",
-            "tidal:",
-            f"  username: {self.var_tidal_username.get().strip()}",
-            f"  password: {tidal_password}",
-            "",
-        ]
-        cfg.write_text("\n".join(content), encoding="utf-8")
-        return tmpdir
-
-    def _run_worker(self, cmd_args):
-        work_dir = Path(self.var_work_dir.get().strip() or Path.cwd())
-        temp_root = None
-        try:
-            temp_root = self._build_temp_config()
-            # Run with temp config.yml as CWD so the tool finds it
-            run_cwd = temp_root
-
-            # Compose full command
-            full_cmd = [sys.executable, "-m", "spotify_to_tidal"] + cmd_args
-
-            self.output_queue.put(f"> Running: {' '.join(full_cmd)}\n")
-            self.output_queue.put(f"> Using config: {run_cwd / 'config.yml'}\n\n")
-
-            env = os.environ.copy()
-            # In case your spotify_to_tidal can take env var to config, add it here.
-            # env["SPOTIFY_TO_TIDAL_CONFIG"] = str(run_cwd / "config.yml")
-
-            self.proc = subprocess.Popen(
-                full_cmd,
-                cwd=run_cwd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                env=env,
-            )
-
-            for line in self.proc.stdout:
-                if self.stop_requested:
-                    break
-                self.output_queue.put(line)
-
-            rc = self.proc.wait()
-            if self.stop_requested:
-                self.output_queue.put("\nProcess terminated by user.\n")
-            elif rc == 0:
-                self.output_queue.put("\n✓ Done. Exit code 0.\n")
-            else:
-                self.output_queue.put(f"\n✗ Finished with exit code {rc}.\n")
-        except FileNotFoundError as e:
-            self.output_queue.put(f"\n✗ Error: {e}\n"
-                                  "Make sure 'spotify_to_tidal' is installed and Python can run it.\n")
-        except Exception as e:
-            self.output_queue.put(f"\n✗ Unexpected error: {e}\n")
-        finally:
-            # Clean up temp dir (remove secrets from disk)
-            if temp_root and temp_root.exists():
-                try:
-                    shutil.rmtree(temp_root, ignore_errors=True)
-                    self.output_queue.put("Temporary config removed.\n")
-                except Exception:
-                    self.output_queue.put("Warning: could not remove temporary config.\n")
-            self.proc = None
-            self.after(0, lambda: self.set_status("Ready."))
-
-    def _drain_output_queue(self):
-        try:
-            while True:
-                line = self.output_queue.get_nowait()
-                self.console.write(line)
-        except queue.Empty:
-            pass
-        # Keep polling while a process is (or might be) running
-        if self.proc is not None and self.proc.poll() is None:
-            self.after(100, self._drain_output_queue)
-        else:
-            # one last sweep after process exits
-            if not self.output_queue.empty():
-                self.after(100, self._drain_output_queue)
-
-def main():
-    app = App()
-    app.mainloop()
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Spotify → TIDAL GUI wrapper for spotify_to_tidal
+------------------------------------------------
+- Beautiful Tkinter UI (tabs, nice layout) with persistent settings.
+- Uses `keyring` to keep secrets (client_secret, TIDAL password) out of plain text.
+- Builds a temporary config.yml (including secrets) ONLY when running a sync.
+- Wraps the CLI: `python -m spotify_to_tidal <subcommand> [args...]`
+- Shows real-time logs, allows cancel.
+
+Requirements:
+  - Python 3.8+
+  - keyring (pip install keyring)  [optional but strongly recommended]
+  - spotify_to_tidal installed (editable is fine): python -m pip install -e .
+  - git + browser auth for Spotify on first run
+
+Tested on Windows, but should work cross-platform.
+
+"""
+
+import ctypes
+import functools
+import json
+import os
+import shlex
+import signal
+import sys
+import tempfile
+import selectors
+import subprocess
+import threading
+from pathlib import Path
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+# --------- Optional secure storage ----------
+# Imported lazily on a background thread (see App._init_keyring): on Linux
+# the DBus backend initializes synchronously and would delay the first
+# window paint by hundreds of ms.
+keyring = None
+KEYRING_AVAILABLE = False
+
+APP_NAME = "spotify_to_tidal_gui"
+SERVICE_NAME = "spotify_to_tidal_gui"  # for keyring
+DEFAULT_REDIRECT_URI = "http://127.0.0.1:8888/callback"  # safer than localhost per repo changes
+
+# Computed once at import; the mkdir here saves a syscall per load/save
+_APP_DATA_DIR = Path(os.getenv("APPDATA") or os.getenv("XDG_CONFIG_HOME")
+                     or Path.home() / ".config") / APP_NAME
+try:
+    _APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+except Exception:
+    pass
+
+SETTINGS_PATH = _APP_DATA_DIR / "settings.json"
+
+def load_settings():
+    try:
+        if SETTINGS_PATH.exists():
+            with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except Exception:
+        pass
+    return {
+        "spotify_client_id": "",
+        "spotify_username": "",
+        "spotify_redirect_uri": DEFAULT_REDIRECT_URI,
+        "tidal_username": "",
+        # secrets are in keyring
+        "last_playlist_url": "",
+        "default_subcommand": "sync",  # change if your CLI uses a different default
+    }
+
+def save_settings(data: dict):
+    # Write compact JSON to a sibling file and rename so a crash mid-write
+    # can never corrupt the settings.
+    tmp = SETTINGS_PATH.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp, SETTINGS_PATH)
+
+def set_secret(name: str, value: str):
+    if not KEYRING_AVAILABLE:
+        return False
+    try:
+        keyring.set_password(SERVICE_NAME, name, value or "")
+        return True
+    except Exception:
+        return False
+
+def get_secret(name: str) -> str:
+    if not KEYRING_AVAILABLE:
+        return ""
+    try:
+        v = keyring.get_password(SERVICE_NAME, name)
+        return v or ""
+    except Exception:
+        return ""
+
+@functools.lru_cache(maxsize=32)
+def _split_flags_cached(s: str) -> tuple:
+    # naive split respecting simple quotes; cached since the same flag
+    # string is usually reused run after run
+    if not s:
+        return ()
+    try:
+        return tuple(shlex.split(s))
+    except Exception:
+        return tuple(s.split())
+
+# In-process entry point, imported lazily on first Run so GUI startup
+# doesn't pay for the CLI's dependency imports.
+_s2t_main = None
+_s2t_import_failed = False
+
+def _load_s2t_main():
+    global _s2t_main, _s2t_import_failed
+    if _s2t_main is None and not _s2t_import_failed:
+        try:
+            from spotify_to_tidal.__main__ import main as _main
+            _s2t_main = _main
+        except Exception:
+            _s2t_import_failed = True
+    return _s2t_main
+
+class _ConsoleWriter:
+    """Minimal file-like object that forwards writes to the log console."""
+
+    def __init__(self, append, tag=None):
+        self._append = append
+        self._tag = tag
+
+    def write(self, s):
+        if s:
+            self._append(s, self._tag)
+        return len(s)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+class LogConsole(ttk.Frame):
+    def __init__(self, master):
+        super().__init__(master)
+        self.max_lines = 5000  # rolling limit so long syncs don't grow the buffer forever
+        self._scroll_pending = False
+        self.text = tk.Text(self, wrap="word", height=16, state="disabled")
+        self.text.tag_configure("stderr", foreground="#b00020")
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
+        self.text.configure(yscrollcommand=self.scroll.set)
+        self.text.grid(row=0, column=0, sticky="nsew")
+        self.scroll.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+    def write(self, s: str, tag=None):
+        self.write_many([(s, tag)])
+
+    def write_many(self, chunks):
+        # chunks is a list of (text, tag) pairs; consecutive runs with the
+        # same tag collapse into one insert. One scroll per batch; let Tk
+        # render on its own idle handler rather than forcing a repaint per
+        # line.
+        self.text.configure(state="normal")
+        i = 0
+        while i < len(chunks):
+            tag = chunks[i][1]
+            j = i
+            while j < len(chunks) and chunks[j][1] == tag:
+                j += 1
+            text = "".join(c[0] for c in chunks[i:j])
+            self.text.insert("end", text, (tag,) if tag else ())
+            i = j
+        # Trim oldest lines so the widget stays a bounded ring buffer
+        count = int(self.text.index("end-1c").split(".")[0])
+        if count > self.max_lines:
+            self.text.delete("1.0", f"{count - self.max_lines + 1}.0")
+        self.text.configure(state="disabled")
+        # Debounce autoscroll: see("end") forces a re-layout, so coalesce
+        # any number of batches per tick into one scroll
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.after_idle(self._do_scroll)
+
+    def _do_scroll(self):
+        self._scroll_pending = False
+        self.text.see("end")
+
+    def clear(self):
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self.text.configure(state="disabled")
+
+class App(tk.Tk):
+    _keyring_warning_shown = False  # warn about missing keyring at most once
+
+    def __init__(self):
+        super().__init__()
+        self.title("Spotify → TIDAL Sync (spotify_to_tidal GUI)")
+        self.geometry("880x620")
+        self.minsize(820, 560)
+        self.style = ttk.Style(self)
+        # Use a built-in theme with nice padding
+        try:
+            self.style.theme_use("clam")
+        except Exception:
+            pass
+
+        self.proc = None
+        self._worker = None
+        self.stop_requested = False
+        self._secret_cache: dict[str, str] = {}
+        self._pending_lines = []
+        self._lines_lock = threading.Lock()
+        self._flush_scheduled = False
+
+        self.settings = load_settings()
+
+        self._build_ui()
+
+        # Fill with saved settings
+        self._load_ui_from_settings()
+
+        # Bring up keyring (and then the stored secrets) off the main thread
+        threading.Thread(target=self._init_keyring, daemon=True).start()
+
+    # ---------- UI ----------
+    def _build_ui(self):
+        container = ttk.Frame(self, padding=12)
+        container.pack(fill="both", expand=True)
+
+        title = ttk.Label(container, text="Spotify → TIDAL Sync", font=("Segoe UI", 18, "bold"))
+        subtitle = ttk.Label(container, text="Beautiful wrapper for spotify_to_tidal — save credentials, run syncs, and see logs.",
+                             foreground="#555")
+
+        title.grid(row=0, column=0, sticky="w")
+        subtitle.grid(row=1, column=0, sticky="w", pady=(0, 8))
+
+        self.nb = ttk.Notebook(container)
+        self.nb.grid(row=2, column=0, sticky="nsew", pady=(4, 8))
+
+        container.grid_rowconfigure(2, weight=1)
+        container.grid_columnconfigure(0, weight=1)
+
+        # Tabs
+        self.tab_setup = ttk.Frame(self.nb, padding=10)
+        self.tab_sync = ttk.Frame(self.nb, padding=10)
+        self.tab_advanced = ttk.Frame(self.nb, padding=10)
+        self.tab_logs = ttk.Frame(self.nb, padding=10)
+
+        self.nb.add(self.tab_setup, text="Setup")
+        self.nb.add(self.tab_sync, text="Sync")
+        self.nb.add(self.tab_advanced, text="Advanced")
+        self.nb.add(self.tab_logs, text="Logs")
+
+        self._build_setup_tab()
+        self._build_sync_tab()
+        self._build_advanced_tab()
+        self._build_logs_tab()
+
+        # Status bar
+        self.status_var = tk.StringVar(value="Ready.")
+        status = ttk.Label(container, textvariable=self.status_var, anchor="w")
+        status.grid(row=3, column=0, sticky="ew")
+
+    def _build_setup_tab(self):
+        f = self.tab_setup
+
+        sec_spotify = ttk.LabelFrame(f, text="Spotify Credentials", padding=10)
+        sec_tidal = ttk.LabelFrame(f, text="TIDAL Credentials", padding=10)
+
+        # Spotify — plain Entries read with .get(); no StringVar round-trips
+        ttk.Label(sec_spotify, text="Client ID").grid(row=0, column=0, sticky="e", padx=4, pady=4)
+        self.e_spotify_client_id = ttk.Entry(sec_spotify, width=46)
+        self.e_spotify_client_id.grid(row=0, column=1, sticky="w", padx=4, pady=4)
+
+        ttk.Label(sec_spotify, text="Client Secret").grid(row=1, column=0, sticky="e", padx=4, pady=4)
+        self.e_spotify_client_secret = ttk.Entry(sec_spotify, width=46, show="•")
+        self.e_spotify_client_secret.grid(row=1, column=1, sticky="w", padx=4, pady=4)
+
+        ttk.Label(sec_spotify, text="Username").grid(row=2, column=0, sticky="e", padx=4, pady=4)
+        self.e_spotify_username = ttk.Entry(sec_spotify, width=46)
+        self.e_spotify_username.grid(row=2, column=1, sticky="w", padx=4, pady=4)
+
+        ttk.Label(sec_spotify, text="Redirect URI").grid(row=3, column=0, sticky="e", padx=4, pady=4)
+        self.e_spotify_redirect = ttk.Entry(sec_spotify, width=46)
+        self.e_spotify_redirect.insert(0, DEFAULT_REDIRECT_URI)
+        self.e_spotify_redirect.grid(row=3, column=1, sticky="w", padx=4, pady=4)
+        ttk.Label(sec_spotify, text="(Use 127.0.0.1, not localhost)").grid(row=3, column=2, sticky="w")
+
+        # TIDAL
+        ttk.Label(sec_tidal, text="Email / Username").grid(row=0, column=0, sticky="e", padx=4, pady=4)
+        self.e_tidal_username = ttk.Entry(sec_tidal, width=46)
+        self.e_tidal_username.grid(row=0, column=1, sticky="w", padx=4, pady=4)
+
+        ttk.Label(sec_tidal, text="Password").grid(row=1, column=0, sticky="e", padx=4, pady=4)
+        self.e_tidal_password = ttk.Entry(sec_tidal, width=46, show="•")
+        self.e_tidal_password.grid(row=1, column=1, sticky="w", padx=4, pady=4)
+
+        # Save / Load
+        btns = ttk.Frame(f)
+        ttk.Button(btns, text="Save Settings", command=self.on_save_settings).pack(side="left", padx=4)
+        ttk.Button(btns, text="Load Settings", command=self.on_load_settings_clicked).pack(side="left", padx=4)
+        ttk.Button(btns, text="Clear Secrets", command=self.on_clear_secrets).pack(side="left", padx=4)
+
+        # Layout
+        sec_spotify.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
+        sec_tidal.grid(row=0, column=1, sticky="nsew")
+        btns.grid(row=1, column=0, columnspan=2, sticky="w", pady=8)
+
+        f.grid_columnconfigure(0, weight=1)
+        f.grid_columnconfigure(1, weight=1)
+
+    def _build_sync_tab(self):
+        f = self.tab_sync
+
+        sec_action = ttk.LabelFrame(f, text="Action", padding=10)
+        sec_args = ttk.LabelFrame(f, text="Arguments", padding=10)
+        sec_run = ttk.LabelFrame(f, text="Run", padding=10)
+
+        # The radio buttons need a shared variable; the entries below don't
+        self.var_action = tk.StringVar(value="sync_playlist_url")
+
+        # Action name -> argv builder; a builder returns None when a required
+        # argument (the playlist URL) is missing.
+        self._action_builders = {
+            "sync_playlist_url": lambda url: ["sync", url] if url else None,
+            "sync_favorites": lambda url: ["favorites"],
+            "sync_all_playlists": lambda url: ["playlists"],
+            "custom": lambda url: ([self.e_subcommand_custom.get().strip() or "sync"]
+                                   + ([url] if url else [])),
+        }
+
+        # Action choices
+        ttk.Radiobutton(sec_action, text="Sync this Spotify playlist URL", value="sync_playlist_url",
+                        variable=self.var_action).grid(row=0, column=0, sticky="w", pady=2)
+        ttk.Radiobutton(sec_action, text="Sync liked/favorite tracks", value="sync_favorites",
+                        variable=self.var_action).grid(row=1, column=0, sticky="w", pady=2)
+        ttk.Radiobutton(sec_action, text="Sync all playlists", value="sync_all_playlists",
+                        variable=self.var_action).grid(row=2, column=0, sticky="w", pady=2)
+        ttk.Radiobutton(sec_action, text="Custom subcommand", value="custom",
+                        variable=self.var_action).grid(row=3, column=0, sticky="w", pady=2)
+
+        # Arguments
+        ttk.Label(sec_args, text="Playlist URL").grid(row=0, column=0, sticky="e", padx=4, pady=4)
+        self.e_playlist_url = ttk.Entry(sec_args, width=64)
+        self.e_playlist_url.grid(row=0, column=1, sticky="w", padx=4, pady=4)
+        ttk.Label(sec_args, text="(Used when action is 'Sync playlist URL')").grid(row=0, column=2, sticky="w", padx=4)
+
+        ttk.Label(sec_args, text="Custom subcommand").grid(row=1, column=0, sticky="e", padx=4, pady=4)
+        self.e_subcommand_custom = ttk.Entry(sec_args, width=32)
+        self.e_subcommand_custom.insert(0, self.settings.get("default_subcommand", "sync"))
+        self.e_subcommand_custom.grid(row=1, column=1, sticky="w", padx=4, pady=4)
+        ttk.Label(sec_args, text="e.g. sync, favorites, playlists").grid(row=1, column=2, sticky="w", padx=4)
+
+        ttk.Label(sec_args, text="Extra flags").grid(row=2, column=0, sticky="e", padx=4, pady=4)
+        self.e_extra_flags = ttk.Entry(sec_args, width=64)
+        self.e_extra_flags.grid(row=2, column=1, sticky="w", padx=4, pady=4)
+        ttk.Label(sec_args, text="e.g. --dry-run --no-duplicates").grid(row=2, column=2, sticky="w", padx=4)
+
+        # Run
+        ttk.Button(sec_run, text="Run", command=self.on_run).grid(row=0, column=0, padx=4, pady=4)
+        ttk.Button(sec_run, text="Cancel", command=self.on_cancel).grid(row=0, column=1, padx=4, pady=4)
+
+        # Layout
+        sec_action.grid(row=0, column=0, sticky="nsew")
+        sec_args.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
+        sec_run.grid(row=1, column=0, columnspan=2, sticky="w", pady=8)
+
+        f.grid_columnconfigure(0, weight=1)
+        f.grid_columnconfigure(1, weight=1)
+
+    def _build_advanced_tab(self):
+        f = self.tab_advanced
+        desc = ("Use this if presets don’t match your installed CLI. "
+                "Pick your subcommand and flags on the Sync tab. "
+                "You can also choose a working directory for the process.\n\n"
+                "Note: We generate a temporary config.yml that includes your secrets, "
+                "pass it to the process, then delete it.")
+        ttk.Label(f, text=desc, wraplength=760, foreground="#555").grid(row=0, column=0, sticky="w", pady=(0, 8))
+
+        ttk.Label(f, text="Working directory").grid(row=1, column=0, sticky="w")
+        row1 = ttk.Frame(f)
+        row1.grid(row=2, column=0, sticky="ew", pady=4)
+        self.e_work_dir = ttk.Entry(row1, width=74)
+        self.e_work_dir.insert(0, str(Path.cwd()))
+        self.e_work_dir.pack(side="left", fill="x", expand=True)
+        ttk.Button(row1, text="Browse…", command=self.on_browse_workdir).pack(side="left", padx=6)
+
+        f.grid_columnconfigure(0, weight=1)
+
+    def _build_logs_tab(self):
+        f = self.tab_logs
+        self.console = LogConsole(f)
+        self.console.grid(row=0, column=0, sticky="nsew")
+        f.grid_rowconfigure(0, weight=1)
+        f.grid_columnconfigure(0, weight=1)
+
+        rows = ttk.Frame(f)
+        rows.grid(row=1, column=0, sticky="ew", pady=6)
+        ttk.Button(rows, text="Clear Logs", command=self.console.clear).pack(side="left", padx=4)
+
+    @staticmethod
+    def _set_entry(entry: ttk.Entry, value: str):
+        entry.delete(0, "end")
+        entry.insert(0, value or "")
+
+    def _get_secret(self, name: str) -> str:
+        # Memoize keyring reads: each get_password is a platform IPC call
+        # (DBus/Win32/Keychain) that can take tens of ms. Only cache once
+        # keyring is actually up — before _init_keyring finishes (or after a
+        # backend error) get_secret returns "", and caching that would stop
+        # the secrets from ever loading for the rest of the session.
+        if name in self._secret_cache:
+            return self._secret_cache[name]
+        value = get_secret(name)
+        if KEYRING_AVAILABLE and value:
+            self._secret_cache[name] = value
+        return value
+
+    def _load_ui_from_settings(self):
+        s = self.settings
+        self._set_entry(self.e_spotify_client_id, s.get("spotify_client_id", ""))
+        self._set_entry(self.e_spotify_username, s.get("spotify_username", ""))
+        self._set_entry(self.e_spotify_redirect, s.get("spotify_redirect_uri", DEFAULT_REDIRECT_URI))
+        self._set_entry(self.e_tidal_username, s.get("tidal_username", ""))
+        self._set_entry(self.e_playlist_url, s.get("last_playlist_url", ""))
+
+        if KEYRING_AVAILABLE:
+            # Don't block window paint on keyring IPC — fetch in the
+            # background and marshal the values back via the event loop.
+            # At first startup keyring isn't imported yet; _init_keyring
+            # takes care of the initial secret load instead.
+            threading.Thread(target=self._load_secrets_async, daemon=True).start()
+
+    def _init_keyring(self):
+        global keyring, KEYRING_AVAILABLE
+        try:
+            import keyring as _keyring
+        except Exception:
+            self.after(0, self._warn_no_keyring)
+            return
+        keyring = _keyring
+        KEYRING_AVAILABLE = True
+        # Already on a background thread, so load the secrets right away
+        self._load_secrets_async()
+
+    def _warn_no_keyring(self):
+        # Warning banner if no keyring — once per process, so reloading
+        # settings doesn't pop a modal every time
+        if App._keyring_warning_shown:
+            return
+        App._keyring_warning_shown = True
+        messagebox.showwarning(
+            "Keyring not available",
+            "Python 'keyring' is not installed or not working.\n"
+            "Secrets will not be saved securely. Install with:\n\n"
+            "    python -m pip install keyring\n"
+        )
+
+    def _load_secrets_async(self):
+        cs = self._get_secret("spotify_client_secret")
+        pw = self._get_secret("tidal_password")
+        self.after(0, lambda: (self._set_entry(self.e_spotify_client_secret, cs),
+                               self._set_entry(self.e_tidal_password, pw)))
+
+    # ---------- Event handlers ----------
+    def on_save_settings(self):
+        s = self.settings
+        s["spotify_client_id"] = self.e_spotify_client_id.get().strip()
+        s["spotify_username"] = self.e_spotify_username.get().strip()
+        s["spotify_redirect_uri"] = self.e_spotify_redirect.get().strip() or DEFAULT_REDIRECT_URI
+        s["tidal_username"] = self.e_tidal_username.get().strip()
+        s["last_playlist_url"] = self.e_playlist_url.get().strip()
+        save_settings(s)
+
+        ok = True
+        self._secret_cache.clear()
+        if self.e_spotify_client_secret.get().strip():
+            ok = set_secret("spotify_client_secret", self.e_spotify_client_secret.get().strip()) and ok
+        if self.e_tidal_password.get().strip():
+            ok = set_secret("tidal_password", self.e_tidal_password.get().strip()) and ok
+
+        if ok or not KEYRING_AVAILABLE:
+            messagebox.showinfo("Saved", "Settings saved.")
+        else:
+            messagebox.showwarning("Saved (with issues)",
+                                  "Settings saved, but secrets may not have been stored in keyring.")
+
+    def on_load_settings_clicked(self):
+        self.settings = load_settings()
+        self._load_ui_from_settings()
+        self.set_status("Settings reloaded.")
+
+    def on_clear_secrets(self):
+        if not KEYRING_AVAILABLE:
+            messagebox.showinfo("No keyring", "Keyring not available — nothing to clear.")
+            return
+        try:
+            set_secret("spotify_client_secret", "")
+            set_secret("tidal_password", "")
+            self._secret_cache.clear()
+            self.e_spotify_client_secret.delete(0, "end")
+            self.e_tidal_password.delete(0, "end")
+            messagebox.showinfo("Cleared", "Secrets cleared from keyring.")
+        except Exception:
+            messagebox.showwarning("Error", "Could not clear secrets.")
+
+    def on_browse_workdir(self):
+        d = filedialog.askdirectory(initialdir=self.e_work_dir.get() or str(Path.cwd()))
+        if d:
+            self._set_entry(self.e_work_dir, d)
+
+    def set_status(self, text: str):
+        self.status_var.set(text)
+        self.update_idletasks()
+
+    def on_cancel(self):
+        proc = self.proc
+        if proc and proc.poll() is None:
+            self.stop_requested = True
+            try:
+                if os.name == "nt":
+                    proc.send_signal(signal.CTRL_BREAK_EVENT)
+                else:
+                    # Signal the whole process group, not just the child
+                    os.killpg(proc.pid, signal.SIGTERM)
+            except Exception:
+                pass
+            # Escalate if the tree ignores the polite request; pass the
+            # Popen so a run started in the meantime is never the target
+            self.after(3000, self._force_kill, proc)
+            self.set_status("Cancellation requested…")
+        elif self._worker and self._worker.is_alive():
+            # In-process run: raise KeyboardInterrupt in the worker thread.
+            # It lands at the next bytecode boundary, so a blocking network
+            # call finishes first, but the sync stops between steps.
+            self.stop_requested = True
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                ctypes.c_ulong(self._worker.ident),
+                ctypes.py_object(KeyboardInterrupt))
+            self.set_status("Cancellation requested…")
+        else:
+            self.set_status("No running process.")
+
+    def _force_kill(self, proc):
+        if proc and proc.poll() is None:
+            try:
+                if os.name == "nt":
+                    proc.kill()
+                else:
+                    os.killpg(proc.pid, signal.SIGKILL)
+            except Exception:
+                pass
+
+    def on_run(self):
+        # Read every field exactly once, resolving secrets against the cache
+        vals = {
+            "spotify_client_id": self.e_spotify_client_id.get().strip(),
+            "spotify_client_secret": (self.e_spotify_client_secret.get().strip()
+                                      or self._get_secret("spotify_client_secret")),
+            "spotify_username": self.e_spotify_username.get().strip(),
+            "spotify_redirect_uri": self.e_spotify_redirect.get().strip() or DEFAULT_REDIRECT_URI,
+            "tidal_username": self.e_tidal_username.get().strip(),
+            "tidal_password": (self.e_tidal_password.get().strip()
+                               or self._get_secret("tidal_password")),
+        }
+
+        # Validate basics
+        if not vals["spotify_client_id"]:
+            messagebox.showerror("Missing", "Spotify Client ID is required.")
+            return
+        if not vals["spotify_client_secret"]:
+            messagebox.showerror("Missing", "Spotify Client Secret is required.")
+            return
+        if not vals["spotify_username"]:
+            messagebox.showerror("Missing", "Spotify Username is required.")
+            return
+        if not vals["tidal_username"]:
+            messagebox.showerror("Missing", "TIDAL Username is required.")
+            return
+        if not vals["tidal_password"]:
+            messagebox.showerror("Missing", "TIDAL Password is required.")
+            return
+
+        # Save current UI values so they persist
+        self.on_save_settings()
+
+        # Prepare command from selections
+        action = self.var_action.get()
+        playlist_url = self.e_playlist_url.get().strip()
+        extra_flags = self._split_flags(self.e_extra_flags.get().strip())
+
+        builder = self._action_builders.get(action, self._action_builders["custom"])
+        cmd_args = builder(playlist_url)
+        if cmd_args is None:
+            messagebox.showerror("Missing", "Please paste a Spotify playlist URL.")
+            return
+
+        # Append extra flags
+        cmd_args.extend(extra_flags)
+
+        # Run in background thread (non-blocking UI)
+        self.console.clear()
+        self.set_status("Running…")
+        self.stop_requested = False
+        t = threading.Thread(target=self._run_worker, args=(cmd_args, vals), daemon=True)
+        self._worker = t
+        t.start()
+
+    @staticmethod
+    def _split_flags(s: str):
+        return list(_split_flags_cached(s))
+
+    # ---------- Process runner ----------
+    def _write_config(self, tmp: Path, vals: dict):
+        cfg = tmp / "config.yml"
+
+        cid = vals["spotify_client_id"]
+        cs = vals["spotify_client_secret"]
+        u = vals["spotify_username"]
+        r = vals["spotify_redirect_uri"]
+        tu = vals["tidal_username"]
+        tp = vals["tidal_password"]
+
+        content = (
+            f"spotify:\n"
+            f"  client_id: {cid}\n"
+            f"  client_secret: {cs}\n"
+            f"  username: {u}\n"
+            f"  redirect_uri: {r}\n"
+            f"\n"
+            f"tidal:\n"
+            f"  username: {tu}\n"
+            f"  password: {tp}\n"
+        )
+        if os.name == "nt":
+            # No meaningful POSIX perms on Windows; chmod is best-effort
+            cfg.write_text(content, encoding="utf-8")
+            os.chmod(cfg, 0o600)
+        else:
+            # 0o600 from the very first byte so the secrets are never
+            # world-readable, not even briefly
+            fd = os.open(str(cfg), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            try:
+                os.write(fd, content.encode("utf-8"))
+            finally:
+                os.close(fd)
+
+    def _run_in_process(self, s2t_main, cmd_args, run_cwd: Path):
+        # The CLI prints rather than using logging, so capture its output by
+        # swapping sys.stdout/sys.stderr for writers that feed the console.
+        argv = list(cmd_args)
+        if "--config" not in argv:
+            argv += ["--config", str(run_cwd / "config.yml")]
+
+        self._append_line(f"> Running in-process: spotify_to_tidal {' '.join(argv)}\n")
+        self._append_line(f"> Using config: {run_cwd / 'config.yml'}\n\n")
+
+        old_argv, old_out, old_err = sys.argv, sys.stdout, sys.stderr
+        sys.argv = ["spotify_to_tidal"] + argv
+        sys.stdout = _ConsoleWriter(self._append_line)
+        sys.stderr = _ConsoleWriter(self._append_line, "stderr")
+        try:
+            s2t_main()
+            rc = 0
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                rc = e.code
+            elif e.code is None:
+                rc = 0
+            else:
+                self._append_line(f"{e.code}\n", "stderr")
+                rc = 1
+        except KeyboardInterrupt:
+            # Injected by on_cancel via PyThreadState_SetAsyncExc
+            rc = 1
+        finally:
+            sys.argv, sys.stdout, sys.stderr = old_argv, old_out, old_err
+
+        if self.stop_requested:
+            self._append_line("\nProcess terminated by user.\n")
+        elif rc == 0:
+            self._append_line("\n✓ Done. Exit code 0.\n")
+        else:
+            self._append_line(f"\n✗ Finished with exit code {rc}.\n")
+
+    def _run_worker(self, cmd_args, vals):
+        # TemporaryDirectory guarantees the secrets are removed even if the
+        # worker raises — no manual rmtree needed.
+        try:
+            with tempfile.TemporaryDirectory(prefix="s2t_gui_") as td:
+                # Run with temp config.yml as CWD so the tool finds it
+                run_cwd = Path(td)
+                self._write_config(run_cwd, vals)
+
+                # Prefer running the CLI in-process: skips interpreter
+                # startup and import cost on every Run. Fall back to a
+                # subprocess when the package isn't importable.
+                s2t_main = _load_s2t_main()
+                if s2t_main is not None:
+                    self._run_in_process(s2t_main, cmd_args, run_cwd)
+                    return
+
+                # Compose full command
+                full_cmd = [sys.executable, "-m", "spotify_to_tidal"] + cmd_args
+
+                self._append_line(f"> Running: {' '.join(full_cmd)}\n")
+                self._append_line(f"> Using config: {run_cwd / 'config.yml'}\n\n")
+
+                env = os.environ.copy()
+                # In case your spotify_to_tidal can take env var to config, add it here.
+                # env["SPOTIFY_TO_TIDAL_CONFIG"] = str(run_cwd / "config.yml")
+
+                # Own process group / console group so cancel can take down
+                # the whole tree, not just the direct child.
+                group_kwargs = (
+                    {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+                    if os.name == "nt" else {"start_new_session": True}
+                )
+                self.proc = subprocess.Popen(
+                    full_cmd,
+                    cwd=run_cwd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=False,
+                    bufsize=0,
+                    env=env,
+                    **group_kwargs,
+                )
+
+                # Grow the kernel pipe buffers (Linux only) so a log-spamming
+                # child doesn't stall waiting on the reader.
+                try:
+                    import fcntl
+                    F_SETPIPE_SZ = 1031
+                    fcntl.fcntl(self.proc.stdout.fileno(), F_SETPIPE_SZ, 1 << 20)
+                    fcntl.fcntl(self.proc.stderr.fileno(), F_SETPIPE_SZ, 1 << 20)
+                except Exception:
+                    pass
+
+                # Drain both pipes concurrently and split lines ourselves:
+                # faster than the text-mode line iterator, stderr can't block
+                # on stdout backpressure, and error lines get tagged red.
+                if os.name == "nt":
+                    # select() only handles sockets on Windows and
+                    # os.set_blocking doesn't exist for pipes there, so use
+                    # one blocking reader thread per pipe instead.
+                    readers = [
+                        threading.Thread(target=self._pump_pipe,
+                                         args=(self.proc.stdout, None), daemon=True),
+                        threading.Thread(target=self._pump_pipe,
+                                         args=(self.proc.stderr, "stderr"), daemon=True),
+                    ]
+                    for r in readers:
+                        r.start()
+                    for r in readers:
+                        r.join()
+                else:
+                    self._pump_pipes_selector()
+
+                rc = self.proc.wait()
+                if self.stop_requested:
+                    self._append_line("\nProcess terminated by user.\n")
+                elif rc == 0:
+                    self._append_line("\n✓ Done. Exit code 0.\n")
+                else:
+                    self._append_line(f"\n✗ Finished with exit code {rc}.\n")
+        except FileNotFoundError as e:
+            self._append_line(f"\n✗ Error: {e}\n"
+                                  "Make sure 'spotify_to_tidal' is installed and Python can run it.\n")
+        except Exception as e:
+            self._append_line(f"\n✗ Unexpected error: {e}\n")
+        finally:
+            self.proc = None
+            self._worker = None
+            self.after(0, lambda: self.set_status("Ready."))
+
+    def _pump_pipe(self, stream, tag):
+        # Windows reader: blocking chunk reads on one pipe
+        fd = stream.fileno()
+        residual = bytearray()
+        while not self.stop_requested:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            residual += data
+            *complete, rest = residual.split(b"\n")
+            residual = bytearray(rest)
+            for raw in complete:
+                self._append_line(raw.decode("utf-8", errors="replace") + "\n", tag)
+        if residual and not self.stop_requested:
+            self._append_line(residual.decode("utf-8", errors="replace"), tag)
+
+    def _pump_pipes_selector(self):
+        # POSIX reader: both pipes non-blocking, multiplexed by a selector
+        sel = selectors.DefaultSelector()
+        residuals = {}
+        tags = {}
+        for stream, tag in ((self.proc.stdout, None), (self.proc.stderr, "stderr")):
+            os.set_blocking(stream.fileno(), False)
+            sel.register(stream, selectors.EVENT_READ, tag)
+            residuals[stream.fileno()] = bytearray()
+            tags[stream.fileno()] = tag
+        while sel.get_map() and not self.stop_requested:
+            for key, _ in sel.select(0.05):
+                fd = key.fileobj.fileno()
+                try:
+                    data = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not data:
+                    sel.unregister(key.fileobj)
+                    continue
+                residual = residuals[fd]
+                residual += data
+                *complete, rest = residual.split(b"\n")
+                residuals[fd] = bytearray(rest)
+                for raw in complete:
+                    self._append_line(raw.decode("utf-8", errors="replace") + "\n", key.data)
+        sel.close()
+        if not self.stop_requested:
+            for fd, residual in residuals.items():
+                if residual:
+                    self._append_line(residual.decode("utf-8", errors="replace"), tags[fd])
+
+    def _append_line(self, s: str, tag=None):
+        # Thread-safe: collect lines and schedule a single flush on the Tk
+        # thread, so a burst of output becomes one Text insert.
+        with self._lines_lock:
+            self._pending_lines.append((s, tag))
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        self.after(0, self._flush_lines)
+
+    def _flush_lines(self):
+        with self._lines_lock:
+            lines, self._pending_lines = self._pending_lines, []
+            self._flush_scheduled = False
+        if lines:
+            self.console.write_many(lines)
+
+def main():
+    app = App()
+    app.mainloop()
+
+if __name__ == "__main__":
+    main()